@@ -0,0 +1,23 @@
+"""JSON encoding for credentials and tokens, using orjson when it is installed."""
+
+import json
+from typing import Any, Callable
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    """Serialize compactly with the stdlib, matching orjson's bytes output."""
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+loads: Callable[[bytes], Any]
+dumps: Callable[[Any], bytes]
+
+# orjson is optional (pip install arclio-login[fast]); fall back to stdlib json
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    loads = json.loads
+    dumps = _stdlib_dumps
@@ -2,21 +2,45 @@
 
 import asyncio
 import sys
-import webbrowser
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import click
-from dotenv import load_dotenv
-from rich.console import Console
 
 from . import __version__, config
 from .kinde_client import get_kinde_client
-from .oauth_server import OAuthCallbackServer
-from .token_manager import get_valid_token
+from .token_manager import get_valid_token, get_valid_token_fast
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+# Rich, python-dotenv, webbrowser and the callback server are imported inside the
+# commands that use them, keeping `arclio token -q` and `arclio --version` fast.
+# Only login needs Rich (for its spinners); the other commands print pre-styled
+# strings with click.echo, which drops the colors when stdout is not a terminal.
+_ACCESS_TOKEN_HEADING = click.style("Access Token:", fg="green")
+_ERROR_LABEL = click.style("Error:", fg="red")
+_STATUS_AUTHENTICATED = click.style("Status:", fg="green") + " Authenticated"
+_STATUS_NOT_AUTHENTICATED = click.style("Status:", fg="yellow") + " Not authenticated"
+_RUN_LOGIN_HINT = "Run: " + click.style("arclio login", bold=True)
+_TOKEN_VALID = "  Token: " + click.style("Valid", fg="green")
+_TOKEN_EXPIRED = "  Token: " + click.style("Expired (will refresh)", fg="yellow")
+_LOGGED_OUT = click.style("Logged out successfully", fg="green")
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _load_env() -> None:
+    """Load environment variables from .env."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 @click.group()
@@ -32,6 +56,8 @@ def main():
 @main.command()
 def login():
     """Login with Kinde OAuth (opens browser)."""
+    _load_env()
+    console = _console()
     client = get_kinde_client()
 
     if not client.is_configured():
@@ -46,8 +72,21 @@ def login():
     asyncio.run(_login_async(client))
 
 
+def _open_browser(url: str) -> None:
+    """Open URL in the default browser, ignoring failures (the URL is printed too)."""
+    import webbrowser
+
+    try:
+        webbrowser.open(url)
+    except Exception:
+        pass
+
+
 async def _login_async(client):
     """Async login flow."""
+    from .oauth_server import OAuthCallbackServer
+
+    console = _console()
     server = OAuthCallbackServer()
 
     try:
@@ -56,13 +95,12 @@ async def _login_async(client):
         auth_url = client.build_auth_url(callback_url)
 
         console.print("[blue]Opening browser for authentication...[/blue]")
+        # click.echo rather than Rich, which would hard-wrap the URL and break copy/paste
+        click.echo(f"If browser does not open: {auth_url}")
 
-        try:
-            webbrowser.open(auth_url)
-        except Exception:
-            console.print()
-            console.print("Could not open browser automatically.")
-            console.print(f"Please open this URL: {auth_url}")
+        # Launching a browser can block for seconds (or silently do nothing on headless
+        # machines); fire it off in a worker thread so the callback wait starts at once
+        asyncio.get_running_loop().run_in_executor(None, _open_browser, auth_url)
 
         with console.status("[bold blue]Waiting for authentication...[/bold blue]"):
             result = await server.wait_for_callback()
@@ -79,8 +117,7 @@ async def _login_async(client):
         with console.status("[bold blue]Getting user info...[/bold blue]"):
             user = await client.get_user_info(tokens.access_token)
 
-        config.set_tokens(tokens)
-        config.set_user_info(user.email, user.sub)
+        config.commit(tokens, user.email, user.sub)
 
         console.print()
         console.print(f"[green]Authenticated as {user.email or user.sub}[/green]")
@@ -88,6 +125,7 @@ async def _login_async(client):
 
     finally:
         server.close()
+        await client.aclose()
 
 
 @main.command()
@@ -95,7 +133,11 @@ async def _login_async(client):
 def token(quiet: bool):
     """Output current access token (refreshes if expired)."""
     try:
-        access_token = asyncio.run(get_valid_token())
+        access_token = get_valid_token_fast()
+        if access_token is None:
+            # Refreshing needs the Kinde settings and an event loop; a valid token needs neither
+            _load_env()
+            access_token = asyncio.run(get_valid_token())
 
         if quiet:
             # Quiet mode: just output the token (no newline for piping)
@@ -104,16 +146,16 @@ def token(quiet: bool):
             # Normal mode: show token with context
             email = config.get_user_email()
 
-            console.print()
-            console.print("[green]Access Token:[/green]")
-            console.print(access_token)
-            console.print()
+            click.echo()
+            click.echo(_ACCESS_TOKEN_HEADING)
+            click.echo(access_token)
+            click.echo()
             if email:
-                console.print(f"  User: {email}")
+                click.echo(f"  User: {email}")
 
     except Exception as e:
         if not quiet:
-            console.print(f"[red]Error:[/red] {e}")
+            click.echo(f"{_ERROR_LABEL} {e}")
         sys.exit(1)
 
 
@@ -121,34 +163,33 @@ def token(quiet: bool):
 def status():
     """Show authentication status."""
     if not config.is_authenticated():
-        console.print("[yellow]Status:[/yellow] Not authenticated")
-        console.print()
-        console.print("Run: [bold]arclio login[/bold]")
+        click.echo(_STATUS_NOT_AUTHENTICATED)
+        click.echo()
+        click.echo(_RUN_LOGIN_HINT)
         return
 
     email = config.get_user_email()
     user_id = config.get_user_id()
     expired = config.is_token_expired()
 
-    console.print("[green]Status:[/green] Authenticated")
+    click.echo(_STATUS_AUTHENTICATED)
     if email:
-        console.print(f"  User: {email}")
+        click.echo(f"  User: {email}")
     if user_id:
-        console.print(f"  ID: {user_id}")
-    token_status = "[yellow]Expired (will refresh)[/yellow]" if expired else "[green]Valid[/green]"
-    console.print(f"  Token: {token_status}")
-    console.print(f"  Config: {config.get_config_path()}")
+        click.echo(f"  ID: {user_id}")
+    click.echo(_TOKEN_EXPIRED if expired else _TOKEN_VALID)
+    click.echo(f"  Config: {config.get_config_path()}")
 
 
 @main.command()
 def logout():
     """Clear stored credentials."""
     if not config.is_authenticated():
-        console.print("Not logged in.")
+        click.echo("Not logged in.")
         return
 
     config.clear_credentials()
-    console.print("[green]Logged out successfully[/green]")
+    click.echo(_LOGGED_OUT)
 
 
 if __name__ == "__main__":
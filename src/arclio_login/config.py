@@ -1,116 +1,197 @@
 """Configuration and credential storage for Arclio Login CLI."""
 
-import json
 import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from . import _json
 from .types import KindeTokens, StoredCredentials
 
 # Config directory: ~/.config/arclio or ~/.arclio
 CONFIG_DIR = Path.home() / ".config" / "arclio"
 CREDENTIALS_FILE = CONFIG_DIR / "credentials.json"
 
+# expires_at used to be stored in milliseconds; any value above this (year 2286 in
+# seconds) is a legacy millisecond timestamp
+_LEGACY_MS_THRESHOLD = 10_000_000_000
+
+# Parsed credentials keyed on (path, inode, mtime_ns, size) of the file they were read from
+_CRED_CACHE: Optional[tuple[tuple[str, int, int, int], dict]] = None
+
+# Config directory already created and restricted by this process
+_DIR_READY: Optional[Path] = None
+
 
 def _ensure_config_dir() -> None:
-    """Ensure config directory exists with proper permissions."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    # Set directory permissions to 700 (owner only)
+    """Ensure config directory exists with proper permissions (once per process)."""
+    global _DIR_READY
+    if _DIR_READY == CONFIG_DIR:
+        return
+    CONFIG_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Set directory permissions to 700 (owner only), also fixing a pre-existing directory
     os.chmod(CONFIG_DIR, 0o700)
+    _DIR_READY = CONFIG_DIR
+
+
+def _cache_key(st: os.stat_result) -> tuple[str, int, int, int]:
+    """Identify the current credentials file contents by path and stat."""
+    return (str(CREDENTIALS_FILE), st.st_ino, st.st_mtime_ns, st.st_size)
 
 
 def _load_credentials() -> dict:
-    """Load credentials from file."""
-    if not CREDENTIALS_FILE.exists():
+    """Load credentials from file.
+
+    The parsed dict is cached for as long as the file is unchanged on disk, so callers
+    must treat the result as read-only and copy it before mutating.
+    """
+    global _CRED_CACHE
+    try:
+        st = os.stat(CREDENTIALS_FILE)
+    except OSError:
         return {}
+    key = _cache_key(st)
+    if _CRED_CACHE is not None and _CRED_CACHE[0] == key:
+        return _CRED_CACHE[1]
     try:
-        with open(CREDENTIALS_FILE) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        data = _json.loads(CREDENTIALS_FILE.read_bytes())
+    except (ValueError, OSError):
         return {}
+    _CRED_CACHE = (key, data)
+    return data
+
+
+def _invalidate_cache() -> None:
+    """Drop the cached credentials so the next read goes to disk."""
+    global _CRED_CACHE
+    _CRED_CACHE = None
 
 
 def _save_credentials(data: dict) -> None:
-    """Save credentials to file with secure permissions."""
+    """Atomically save credentials to file with secure permissions.
+
+    The written dict becomes the cached copy, so reads right after a save skip the disk.
+    """
+    global _CRED_CACHE
+    _invalidate_cache()
     _ensure_config_dir()
-    with open(CREDENTIALS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-    # Set file permissions to 600 (owner read/write only)
-    os.chmod(CREDENTIALS_FILE, 0o600)
+    payload = _json.dumps(data)
+    tmp_path = f"{CREDENTIALS_FILE}.{os.getpid()}.tmp"
+    # Remove any leftover from an interrupted save: O_EXCL guarantees the file is created
+    # here with 600 permissions (owner read/write only) rather than reusing a stale mode
+    try:
+        os.unlink(tmp_path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp_path, CREDENTIALS_FILE)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    # The renamed file keeps the inode and mtime fstat saw before the replace
+    _CRED_CACHE = (_cache_key(st), data)
+
+
+def _get_field(name: str) -> Any:
+    """Get a single field from the cached credentials."""
+    return _load_credentials().get(name)
 
 
 def get_access_token() -> Optional[str]:
     """Get stored access token."""
-    creds = _load_credentials()
-    return creds.get("access_token")
+    return _get_field("access_token")
 
 
 def get_refresh_token() -> Optional[str]:
     """Get stored refresh token."""
-    creds = _load_credentials()
-    return creds.get("refresh_token")
+    return _get_field("refresh_token")
+
+
+def _normalize_expires_at(expires_at: Optional[int]) -> Optional[int]:
+    """Convert a legacy millisecond timestamp to seconds."""
+    if expires_at and expires_at > _LEGACY_MS_THRESHOLD:
+        return expires_at // 1000
+    return expires_at
 
 
 def get_expires_at() -> Optional[int]:
-    """Get token expiration timestamp (milliseconds)."""
-    creds = _load_credentials()
-    return creds.get("expires_at")
+    """Get token expiration timestamp (Unix seconds)."""
+    return _normalize_expires_at(_get_field("expires_at"))
 
 
 def get_user_email() -> Optional[str]:
     """Get stored user email."""
-    creds = _load_credentials()
-    return creds.get("user_email")
+    return _get_field("user_email")
 
 
 def get_user_id() -> Optional[str]:
     """Get stored user ID."""
-    creds = _load_credentials()
-    return creds.get("user_id")
+    return _get_field("user_id")
 
 
 def is_token_expired() -> bool:
     """Check if token is expired (with 60-second buffer)."""
-    import time
-
-    expires_at = get_expires_at()
+    expires_at = _normalize_expires_at(_get_field("expires_at"))
     if expires_at is None:
         return True
     # Consider expired 60 seconds before actual expiry
-    return time.time() * 1000 > (expires_at - 60000)
+    return int(time.time()) > expires_at - 60
 
 
 def is_authenticated() -> bool:
     """Check if user has stored credentials."""
-    return get_access_token() is not None
-
+    return _get_field("access_token") is not None
 
-def set_tokens(tokens: KindeTokens) -> None:
-    """Store tokens from OAuth response."""
-    import time
 
-    creds = _load_credentials()
+def _apply_tokens(creds: dict, tokens: KindeTokens) -> None:
+    """Copy token fields into a credentials dict."""
     creds["access_token"] = tokens.access_token
     if tokens.refresh_token:
         creds["refresh_token"] = tokens.refresh_token
     if tokens.id_token:
         creds["id_token"] = tokens.id_token
-    # Calculate absolute expiry time in milliseconds
-    creds["expires_at"] = int(time.time() * 1000) + (tokens.expires_in * 1000)
-    _save_credentials(creds)
+    # Calculate absolute expiry time in seconds
+    creds["expires_at"] = int(time.time()) + tokens.expires_in
 
 
-def set_user_info(email: Optional[str], user_id: str) -> None:
-    """Store user info."""
-    creds = _load_credentials()
+def _apply_user_info(creds: dict, email: Optional[str], user_id: str) -> None:
+    """Copy user info fields into a credentials dict."""
     if email:
         creds["user_email"] = email
     creds["user_id"] = user_id
+
+
+def set_tokens(tokens: KindeTokens) -> None:
+    """Store tokens from OAuth response."""
+    creds = dict(_load_credentials())
+    _apply_tokens(creds, tokens)
+    _save_credentials(creds)
+
+
+def set_user_info(email: Optional[str], user_id: str) -> None:
+    """Store user info."""
+    creds = dict(_load_credentials())
+    _apply_user_info(creds, email, user_id)
+    _save_credentials(creds)
+
+
+def commit(tokens: KindeTokens, email: Optional[str], user_id: str) -> None:
+    """Store tokens and user info from a login in a single write."""
+    creds = dict(_load_credentials())
+    _apply_tokens(creds, tokens)
+    _apply_user_info(creds, email, user_id)
     _save_credentials(creds)
 
 
 def clear_credentials() -> None:
     """Clear all stored credentials."""
+    _invalidate_cache()
     if CREDENTIALS_FILE.exists():
         CREDENTIALS_FILE.unlink()
 
@@ -129,7 +210,7 @@ def get_stored_credentials() -> Optional[StoredCredentials]:
         access_token=creds["access_token"],
         refresh_token=creds.get("refresh_token"),
         id_token=creds.get("id_token"),
-        expires_at=creds.get("expires_at"),
+        expires_at=_normalize_expires_at(creds.get("expires_at")),
         user_email=creds.get("user_email"),
         user_id=creds.get("user_id"),
     )
@@ -1,15 +1,34 @@
 """Kinde OAuth client for browser-based authentication."""
 
-import base64
-import json
+import binascii
 import os
-import secrets
-from typing import Optional
-
-import httpx
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote, urlencode
 
+from . import _json
 from .types import KindeTokens, KindeUser
 
+if TYPE_CHECKING:
+    import httpx
+
+_SCOPE = "openid profile email offline"
+
+# header.payload.signature; only the payload is captured (signature may be empty for alg=none)
+_JWT_RE = re.compile(r"[^.]+\.([^.]+)\.[^.]*")
+
+# JWT segments and state/nonce values are unpadded base64url; pad is indexed by length % 4
+_B64URL_TO_STD = bytes.maketrans(b"-_", b"+/")
+_STD_TO_B64URL = bytes.maketrans(b"+/", b"-_")
+_B64_PAD = (b"", b"===", b"==", b"=")
+
+
+def _urlsafe_token(nbytes: int) -> str:
+    """Random URL-safe text, equivalent to secrets.token_urlsafe without its wrappers."""
+    encoded = binascii.b2a_base64(os.urandom(nbytes), newline=False)
+    return encoded.rstrip(b"=").translate(_STD_TO_B64URL).decode("ascii")
+
 
 class KindeClient:
     """OAuth client for Kinde authentication."""
@@ -23,126 +42,146 @@ class KindeClient:
         self.domain = domain or os.getenv("KINDE_AUTH_DOMAIN") or os.getenv("KINDE_DOMAIN") or ""
         self.client_id = client_id or os.getenv("KINDE_CLIENT_ID") or ""
         self.client_secret = client_secret or os.getenv("KINDE_CLIENT_SECRET") or ""
+        self._configured = bool(self.domain and self.client_id and self.client_secret)
+        self._auth_endpoint = f"{self.domain}/oauth2/auth"
+        self._http: Optional["httpx.AsyncClient"] = None
 
     def is_configured(self) -> bool:
         """Check if client has required configuration."""
-        return bool(self.domain and self.client_id and self.client_secret)
+        return self._configured
+
+    async def _client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None:
+            # Imported lazily: httpx is only needed once we talk to Kinde
+            import httpx
+
+            self._http = httpx.AsyncClient(
+                base_url=self.domain,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def build_auth_url(self, redirect_uri: str) -> str:
         """Build OAuth authorization URL."""
-        state = secrets.token_urlsafe(32)
-        nonce = secrets.token_urlsafe(32)
+        # One 64-byte draw split into two 32-byte (43-char) values
+        random = _urlsafe_token(64)
+        state, nonce = random[:43], random[43:]
 
         params = {
             "client_id": self.client_id,
             "redirect_uri": redirect_uri,
             "response_type": "code",
-            "scope": "openid profile email offline",
+            "scope": _SCOPE,
             "state": state,
             "nonce": nonce,
         }
 
-        query = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{self.domain}/oauth2/auth?{query}"
+        # ":" and "/" are valid in a query component, so redirect_uri stays readable
+        query = urlencode(params, safe=":/", quote_via=quote)
+        return f"{self._auth_endpoint}?{query}"
 
     async def exchange_code_for_token(self, code: str, redirect_uri: str) -> KindeTokens:
         """Exchange authorization code for tokens."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.domain}/oauth2/token",
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_description") or error_data.get("error")
-                except Exception:
-                    error_msg = response.text
-                raise Exception(f"Token exchange failed: {error_msg}")
-
-            data = response.json()
-            return KindeTokens(
-                access_token=data["access_token"],
-                refresh_token=data.get("refresh_token"),
-                id_token=data.get("id_token"),
-                token_type=data.get("token_type", "Bearer"),
-                expires_in=data.get("expires_in", 3600),
-            )
+        client = await self._client()
+        response = await client.post(
+            "/oauth2/token",
+            data={
+                "grant_type": "authorization_code",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "redirect_uri": redirect_uri,
+            },
+        )
+
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error_description") or error_data.get("error")
+            except Exception:
+                error_msg = response.text
+            raise Exception(f"Token exchange failed: {error_msg}")
+
+        data = response.json()
+        return KindeTokens(
+            access_token=data["access_token"],
+            refresh_token=data.get("refresh_token"),
+            id_token=data.get("id_token"),
+            token_type=data.get("token_type", "Bearer"),
+            expires_in=data.get("expires_in", 3600),
+        )
 
     async def refresh_token(self, refresh_token: str) -> KindeTokens:
         """Refresh access token using refresh token."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.domain}/oauth2/token",
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": refresh_token,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if response.status_code != 200:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_description") or error_data.get("error")
-                except Exception:
-                    error_msg = response.text
-                raise Exception(f"Token refresh failed: {error_msg}")
-
-            data = response.json()
-            return KindeTokens(
-                access_token=data["access_token"],
-                refresh_token=data.get("refresh_token") or refresh_token,
-                id_token=data.get("id_token"),
-                token_type=data.get("token_type", "Bearer"),
-                expires_in=data.get("expires_in", 3600),
-            )
+        client = await self._client()
+        response = await client.post(
+            "/oauth2/token",
+            data={
+                "grant_type": "refresh_token",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": refresh_token,
+            },
+        )
+
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+                error_msg = error_data.get("error_description") or error_data.get("error")
+            except Exception:
+                error_msg = response.text
+            raise Exception(f"Token refresh failed: {error_msg}")
+
+        data = response.json()
+        return KindeTokens(
+            access_token=data["access_token"],
+            refresh_token=data.get("refresh_token") or refresh_token,
+            id_token=data.get("id_token"),
+            token_type=data.get("token_type", "Bearer"),
+            expires_in=data.get("expires_in", 3600),
+        )
 
     async def get_user_info(self, access_token: str) -> KindeUser:
         """Get user info from access token."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.domain}/oauth2/v2/user_profile",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+        client = await self._client()
+        response = await client.get(
+            "/oauth2/v2/user_profile",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                return KindeUser(
-                    sub=data["sub"],
-                    email=data.get("email"),
-                    given_name=data.get("given_name"),
-                    family_name=data.get("family_name"),
-                    picture=data.get("picture"),
-                )
+        if response.status_code == 200:
+            data = response.json()
+            return KindeUser(
+                sub=data["sub"],
+                email=data.get("email"),
+                given_name=data.get("given_name"),
+                family_name=data.get("family_name"),
+                picture=data.get("picture"),
+            )
 
-            # Fallback: decode JWT to get basic info
-            return self._decode_token(access_token)
+        # Fallback: decode JWT to get basic info
+        return self._decode_token(access_token)
 
     def _decode_token(self, token: str) -> KindeUser:
         """Decode JWT token to extract user info (without verification)."""
         try:
-            parts = token.split(".")
-            if len(parts) != 3:
+            match = _JWT_RE.fullmatch(token)
+            if not match:
                 raise ValueError("Invalid JWT format")
 
-            # Decode payload (add padding if needed)
-            payload_b64 = parts[1]
-            padding = 4 - len(payload_b64) % 4
-            if padding != 4:
-                payload_b64 += "=" * padding
+            # Decode payload: map base64url to standard base64 and restore the padding JWTs strip
+            segment = match.group(1).encode("ascii")
+            raw = segment.translate(_B64URL_TO_STD) + _B64_PAD[len(segment) & 3]
 
-            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+            payload = _json.loads(binascii.a2b_base64(raw))
 
             return KindeUser(
                 sub=payload.get("sub", ""),
@@ -155,13 +194,7 @@ class KindeClient:
             raise Exception(f"Failed to decode JWT token: {e}")
 
 
-# Singleton instance (lazy-initialized)
-_kinde_client: Optional[KindeClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_kinde_client() -> KindeClient:
     """Get or create singleton KindeClient instance."""
-    global _kinde_client
-    if _kinde_client is None:
-        _kinde_client = KindeClient()
-    return _kinde_client
+    return KindeClient()
@@ -2,10 +2,9 @@
 
 import asyncio
 import html
+import re
 import socket
 from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from threading import Thread
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
@@ -14,98 +13,11 @@ from .logo import LOGO_DATA_URI
 DEFAULT_PORTS = [3100, 3101, 3102, 3103, 3104]
 CALLBACK_TIMEOUT = 120  # seconds
 
+_REQUEST_LINE = re.compile(rb"GET (\S+) HTTP/1\.[01]\r\n")
 
-@dataclass
-class OAuthCallbackResult:
-    """Result from OAuth callback."""
-
-    code: str
-    state: Optional[str] = None
-    error: Optional[str] = None
-    error_description: Optional[str] = None
-
-
-class OAuthCallbackServer:
-    """Local HTTP server to receive OAuth callback."""
-
-    def __init__(self):
-        self.port: int = 0
-        self.server: Optional[HTTPServer] = None
-        self.result: Optional[OAuthCallbackResult] = None
-        self._server_thread: Optional[Thread] = None
-
-    def _find_available_port(self, ports: list[int] = DEFAULT_PORTS) -> int:
-        """Find first available port from list."""
-        for port in ports:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(("127.0.0.1", port))
-                    return port
-                except OSError:
-                    continue
-        raise Exception(f"No available ports in range: {ports}")
-
-    def start(self, ports: list[int] = DEFAULT_PORTS) -> int:
-        """Start server on available port."""
-        self.port = self._find_available_port(ports)
-        server_instance = self
-
-        class CallbackHandler(BaseHTTPRequestHandler):
-            def log_message(self, format, *args):
-                # Suppress logging
-                pass
-
-            def do_GET(self):
-                parsed = urlparse(self.path)
-
-                if parsed.path == "/callback":
-                    params = parse_qs(parsed.query)
-
-                    error = params.get("error", [None])[0]
-                    if error:
-                        server_instance.result = OAuthCallbackResult(
-                            code="",
-                            error=error,
-                            error_description=params.get("error_description", [None])[0],
-                        )
-                        self._send_error_page(error, params.get("error_description", [""])[0])
-                        return
-
-                    code = params.get("code", [None])[0]
-                    if not code:
-                        server_instance.result = OAuthCallbackResult(
-                            code="",
-                            error="missing_code",
-                            error_description="Authorization code not received",
-                        )
-                        self.send_response(400)
-                        self.end_headers()
-                        self.wfile.write(b"Authorization code missing")
-                        return
-
-                    # Success
-                    server_instance.result = OAuthCallbackResult(
-                        code=code,
-                        state=params.get("state", [None])[0],
-                    )
-                    self._send_success_page()
-
-                elif parsed.path == "/health":
-                    self.send_response(200)
-                    self.send_header("Content-Type", "application/json")
-                    self.end_headers()
-                    self.wfile.write(b'{"status": "ok"}')
-
-                else:
-                    self.send_response(404)
-                    self.end_headers()
-
-            def _send_success_page(self):
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html")
-                self.end_headers()
-                self.wfile.write(
-                    f"""<!DOCTYPE html>
+# Callback pages are built once at import; only the error detail varies per request
+_SUCCESS_PAGE = (
+    f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Authentication Successful</title>
@@ -155,17 +67,11 @@ class OAuthCallbackServer:
     </div>
     <script>setTimeout(() => window.close(), 3000)</script>
 </body>
-</html>""".encode()
-                )
+</html>"""
+).encode()
 
-            def _send_error_page(self, error: str, description: str):
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html")
-                self.end_headers()
-                safe_error = html.escape(str(error))
-                safe_desc = html.escape(str(description or "Unknown error"))
-                self.wfile.write(
-                    f"""<!DOCTYPE html>
+_ERROR_PAGE_HEAD = (
+    f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Authentication Failed</title>
@@ -218,17 +124,83 @@ class OAuthCallbackServer:
         <div class="status-icon">&#10007;</div>
         <h1>Authentication Failed</h1>
         <p>There was an error during authentication.</p>
-        <p class="error">{safe_error}: {safe_desc}</p>
+        <p class="error">"""
+).encode()
+
+_ERROR_PAGE_TAIL = """</p>
         <p>You can close this window and return to the terminal.</p>
     </div>
     <script>setTimeout(() => window.close(), 3000)</script>
 </body>
 </html>""".encode()
-                )
 
-        self.server = HTTPServer(("127.0.0.1", self.port), CallbackHandler)
-        self._server_thread = Thread(target=self.server.serve_forever, daemon=True)
-        self._server_thread.start()
+
+def _error_page(error: str, description: Optional[str]) -> bytes:
+    """Render the error page around an escaped error line."""
+    safe_error = html.escape(str(error))
+    safe_desc = html.escape(str(description or "Unknown error"))
+    return _ERROR_PAGE_HEAD + f"{safe_error}: {safe_desc}".encode() + _ERROR_PAGE_TAIL
+
+
+def _http_response(status: str, body: bytes = b"", content_type: Optional[str] = None) -> bytes:
+    """Build a complete HTTP/1.1 response that closes the connection."""
+    headers = f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n"
+    if content_type:
+        headers += f"Content-Type: {content_type}\r\n"
+    return headers.encode() + b"\r\n" + body
+
+
+@dataclass
+class OAuthCallbackResult:
+    """Result from OAuth callback."""
+
+    code: str
+    state: Optional[str] = None
+    error: Optional[str] = None
+    error_description: Optional[str] = None
+
+
+class OAuthCallbackServer:
+    """Local HTTP server to receive OAuth callback."""
+
+    def __init__(self):
+        self.port: int = 0
+        self.server: Optional[socket.socket] = None
+        self.result: Optional[OAuthCallbackResult] = None
+        self._done = asyncio.Event()
+        self._serve_task: Optional[asyncio.Task] = None
+        self._aio_server: Optional[asyncio.Server] = None
+
+    def _bind(self, ports: list[int] = DEFAULT_PORTS) -> socket.socket:
+        """Bind the listening socket to the first free port from list.
+
+        Only these ports' callback URLs are registered with Kinde, so there is no fallback
+        to a kernel-assigned port.
+        """
+        for port in ports:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                # Allow rebinding a port left in TIME_WAIT by a previous login
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(("127.0.0.1", port))
+                sock.listen(16)
+            except OSError:
+                sock.close()
+                continue
+            sock.setblocking(False)
+            return sock
+        raise Exception(f"No available ports in range: {ports}")
+
+    def start(self, ports: list[int] = DEFAULT_PORTS) -> int:
+        """Start server on available port."""
+        self.server = self._bind(ports)
+        self.port = self.server.getsockname()[1]
+        try:
+            self._ensure_serving()
+        except RuntimeError:
+            # No running loop yet: connections wait in the listen backlog until
+            # wait_for_callback starts serving
+            pass
 
         return self.port
 
@@ -236,23 +208,93 @@ class OAuthCallbackServer:
         """Get callback URL for OAuth redirect."""
         return f"http://localhost:{self.port}/callback"
 
+    def _ensure_serving(self) -> asyncio.Task:
+        """Start accepting connections on the running event loop (once)."""
+        if self._serve_task is None:
+            self._serve_task = asyncio.get_running_loop().create_task(self._serve())
+        return self._serve_task
+
+    async def _serve(self) -> None:
+        """Attach the listening socket to an asyncio server."""
+        self._aio_server = await asyncio.start_server(self._handle, sock=self.server)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer a single HTTP request and close the connection."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            match = _REQUEST_LINE.match(head)
+            if match:
+                response = self._respond(match.group(1).decode("latin-1"))
+            else:
+                response = _http_response("400 Bad Request")
+            writer.write(response)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, target: str) -> bytes:
+        """Route a request target, recording the OAuth result for /callback."""
+        parsed = urlparse(target)
+
+        if parsed.path == "/callback":
+            params = parse_qs(parsed.query)
+
+            error = params.get("error", [None])[0]
+            if error:
+                description = params.get("error_description", [None])[0]
+                self._set_result(
+                    OAuthCallbackResult(code="", error=error, error_description=description)
+                )
+                return _http_response("200 OK", _error_page(error, description), "text/html")
+
+            code = params.get("code", [None])[0]
+            if not code:
+                self._set_result(
+                    OAuthCallbackResult(
+                        code="",
+                        error="missing_code",
+                        error_description="Authorization code not received",
+                    )
+                )
+                return _http_response("400 Bad Request", b"Authorization code missing")
+
+            # Success
+            self._set_result(OAuthCallbackResult(code=code, state=params.get("state", [None])[0]))
+            return _http_response("200 OK", _SUCCESS_PAGE, "text/html")
+
+        if parsed.path == "/health":
+            return _http_response("200 OK", b'{"status": "ok"}', "application/json")
+
+        return _http_response("404 Not Found")
+
+    def _set_result(self, result: OAuthCallbackResult) -> None:
+        """Record the callback result and wake wait_for_callback."""
+        self.result = result
+        self._done.set()
+
     async def wait_for_callback(self, timeout: float = CALLBACK_TIMEOUT) -> OAuthCallbackResult:
         """Wait for OAuth callback with timeout."""
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            if self.result:
-                return self.result
+        await self._ensure_serving()
 
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout:
-                self.close()
-                raise Exception("Authentication timed out. Please try again.")
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.close()
+            raise Exception("Authentication timed out. Please try again.")
 
-            await asyncio.sleep(0.1)
+        assert self.result is not None
+        return self.result
 
     def close(self) -> None:
         """Shutdown server."""
+        if self._aio_server:
+            self._aio_server.close()
+            self._aio_server = None
+        if self._serve_task and not self._serve_task.done():
+            self._serve_task.cancel()
+        self._serve_task = None
         if self.server:
-            self.server.shutdown()
+            self.server.close()
             self.server = None
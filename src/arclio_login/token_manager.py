@@ -1,11 +1,19 @@
 """Token management with automatic refresh."""
 
 import asyncio
+from typing import Optional
 
 from . import config
 from .kinde_client import get_kinde_client
 
 
+def get_valid_token_fast() -> Optional[str]:
+    """Get the stored access token if it is still valid, without refreshing."""
+    if config.is_token_expired():
+        return None
+    return config.get_access_token()
+
+
 async def get_valid_token() -> str:
     """Get a valid access token, refreshing if expired."""
     access_token = config.get_access_token()
@@ -22,7 +30,10 @@ async def get_valid_token() -> str:
         raise Exception("Token expired and no refresh token. Run: arclio login")
 
     client = get_kinde_client()
-    tokens = await client.refresh_token(refresh_token)
+    try:
+        tokens = await client.refresh_token(refresh_token)
+    finally:
+        await client.aclose()
     config.set_tokens(tokens)
 
     return tokens.access_token
@@ -30,4 +41,5 @@ async def get_valid_token() -> str:
 
 def get_valid_token_sync() -> str:
     """Synchronous wrapper for get_valid_token."""
-    return asyncio.get_event_loop().run_until_complete(get_valid_token())
+    # Only start an event loop when the stored token needs refreshing
+    return get_valid_token_fast() or asyncio.run(get_valid_token())
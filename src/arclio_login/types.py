@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KindeTokens:
     """Tokens received from Kinde OAuth."""
 
@@ -15,7 +15,7 @@ class KindeTokens:
     expires_in: int = 3600
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KindeUser:
     """User info from Kinde."""
 
@@ -26,13 +26,13 @@ class KindeUser:
     picture: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoredCredentials:
     """Credentials stored locally."""
 
     access_token: str
     refresh_token: Optional[str] = None
     id_token: Optional[str] = None
-    expires_at: Optional[int] = None  # Unix timestamp in milliseconds
+    expires_at: Optional[int] = None  # Unix timestamp in seconds
     user_email: Optional[str] = None
     user_id: Optional[str] = None
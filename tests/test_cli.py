@@ -8,6 +8,7 @@ from click.testing import CliRunner
 
 from arclio_login import config
 from arclio_login.cli import main
+from arclio_login.kinde_client import get_kinde_client
 from arclio_login.types import KindeTokens
 
 
@@ -38,6 +39,18 @@ class TestStatusCommand:
         assert result.exit_code == 0
         assert "Authenticated" in result.output
         assert "test@example.com" in result.output
+        assert f"Config: {temp_config_dir / 'credentials.json'}" in result.output
+
+    def test_status_plain_when_not_tty(self, runner: CliRunner, temp_config_dir: Path):
+        """Test that status output carries no color codes when piped."""
+        tokens = KindeTokens(access_token="test_token", expires_in=3600)
+        config.set_tokens(tokens)
+
+        result = runner.invoke(main, ["status"])
+
+        assert result.exit_code == 0
+        assert "\x1b[" not in result.output
+        assert "Token: Valid" in result.output
 
 
 class TestLogoutCommand:
@@ -81,6 +94,18 @@ class TestTokenCommand:
         assert result.exit_code == 0
         assert result.output == "test_access_token"  # No newline in quiet mode
 
+    def test_token_valid_skips_event_loop(self, runner: CliRunner, temp_config_dir: Path):
+        """Test that a valid stored token is returned without running the async path."""
+        tokens = KindeTokens(access_token="test_access_token", expires_in=3600)
+        config.set_tokens(tokens)
+
+        with patch("arclio_login.cli.asyncio.run") as run:
+            result = runner.invoke(main, ["token", "-q"])
+
+        assert result.exit_code == 0
+        assert result.output == "test_access_token"
+        run.assert_not_called()
+
 
 class TestLoginCommand:
     """Tests for login command."""
@@ -89,9 +114,7 @@ class TestLoginCommand:
         """Test login when Kinde not configured."""
         with patch.dict("os.environ", {}, clear=True):
             # Need to reset the singleton to pick up new env vars
-            import arclio_login.kinde_client as kc
-
-            kc._kinde_client = None
+            get_kinde_client.cache_clear()
 
             result = runner.invoke(main, ["login"])
 
@@ -2,9 +2,11 @@
 
 import json
 import os
+import time
 from pathlib import Path
+from unittest.mock import patch
 
-from arclio_login import config
+from arclio_login import _json, config
 from arclio_login.types import KindeTokens
 
 
@@ -70,6 +72,33 @@ class TestConfigStorage:
 
         assert config.is_token_expired()
 
+    def test_commit(self, temp_config_dir: Path):
+        """Test storing tokens and user info together."""
+        tokens = KindeTokens(
+            access_token="test_access_token",
+            refresh_token="test_refresh_token",
+            expires_in=3600,
+        )
+
+        config.commit(tokens, "test@example.com", "user_123")
+
+        assert config.get_access_token() == "test_access_token"
+        assert config.get_refresh_token() == "test_refresh_token"
+        assert config.get_user_email() == "test@example.com"
+        assert config.get_user_id() == "user_123"
+        assert list(temp_config_dir.iterdir()) == [temp_config_dir / "credentials.json"]
+
+    def test_legacy_millisecond_expiry(self, temp_config_dir: Path):
+        """Test that expires_at stored in milliseconds is still understood."""
+        expires_at_ms = (int(time.time()) + 3600) * 1000
+        creds = {"access_token": "test", "expires_at": expires_at_ms}
+        creds_file = temp_config_dir / "credentials.json"
+        with open(creds_file, "w") as f:
+            json.dump(creds, f)
+
+        assert config.get_expires_at() == expires_at_ms // 1000
+        assert not config.is_token_expired()
+
     def test_file_permissions(self, temp_config_dir: Path):
         """Test that credentials file has secure permissions."""
         tokens = KindeTokens(access_token="test_token", expires_in=3600)
@@ -80,6 +109,57 @@ class TestConfigStorage:
 
         assert mode == 0o600, f"Expected 600, got {oct(mode)}"
 
+    def test_config_dir_permissions(self, temp_config_dir: Path):
+        """Test that the config directory is restricted to the owner."""
+        os.chmod(temp_config_dir, 0o755)
+        tokens = KindeTokens(access_token="test_token", expires_in=3600)
+        config.set_tokens(tokens)
+
+        mode = os.stat(temp_config_dir).st_mode & 0o777
+
+        assert mode == 0o700, f"Expected 700, got {oct(mode)}"
+
+
+class TestCredentialsCache:
+    """Tests for in-process credentials caching."""
+
+    def test_repeated_reads_parse_once(self, temp_config_dir: Path):
+        """Test that unchanged credentials are only parsed once."""
+        creds = {"access_token": "test_token", "expires_at": int(time.time()) + 3600}
+        with open(temp_config_dir / "credentials.json", "w") as f:
+            json.dump(creds, f)
+
+        with patch("arclio_login._json.loads", wraps=_json.loads) as load:
+            config.get_access_token()
+            config.is_token_expired()
+            config.get_user_email()
+
+        assert load.call_count == 1
+
+    def test_read_after_save_uses_written_data(self, temp_config_dir: Path):
+        """Test that reading right after a save does not re-parse the file."""
+        tokens = KindeTokens(access_token="test_token", expires_in=3600)
+
+        with patch("arclio_login._json.loads", wraps=_json.loads) as load:
+            config.set_tokens(tokens)
+            assert config.get_access_token() == "test_token"
+            config.set_user_info("test@example.com", "user_123")
+            assert config.get_user_email() == "test@example.com"
+
+        assert load.call_count == 0
+
+    def test_external_change_invalidates_cache(self, temp_config_dir: Path):
+        """Test that a rewritten credentials file is picked up."""
+        tokens = KindeTokens(access_token="old_token", expires_in=3600)
+        config.set_tokens(tokens)
+        assert config.get_access_token() == "old_token"
+
+        creds_file = temp_config_dir / "credentials.json"
+        with open(creds_file, "w") as f:
+            json.dump({"access_token": "new_token_from_elsewhere"}, f)
+
+        assert config.get_access_token() == "new_token_from_elsewhere"
+
 
 class TestStoredCredentials:
     """Tests for StoredCredentials dataclass."""
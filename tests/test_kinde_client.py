@@ -1,7 +1,12 @@
 """Tests for Kinde OAuth client."""
 
+import base64
+import json
 import os
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
 
 from arclio_login.kinde_client import KindeClient, get_kinde_client
 
@@ -35,6 +40,25 @@ class TestKindeClient:
         assert "state=" in url
         assert "nonce=" in url
 
+    def test_build_auth_url_state_and_nonce(self, mock_env_vars):
+        """Test that state and nonce are distinct full-length random values."""
+        client = KindeClient()
+
+        params = parse_qs(urlparse(client.build_auth_url("http://localhost:3100/callback")).query)
+
+        assert len(params["state"][0]) == 43
+        assert len(params["nonce"][0]) == 43
+        assert params["state"][0] != params["nonce"][0]
+
+    def test_build_auth_url_encodes_params(self, mock_env_vars):
+        """Test that query parameters are percent-encoded."""
+        client = KindeClient()
+
+        url = client.build_auth_url("http://localhost:3100/callback?next=a&b c")
+
+        assert "redirect_uri=http://localhost:3100/callback%3Fnext%3Da%26b%20c&" in url
+        assert "scope=openid%20profile%20email%20offline" in url
+
     def test_build_auth_url_with_custom_config(self):
         """Test URL building with custom configuration."""
         client = KindeClient(
@@ -48,14 +72,24 @@ class TestKindeClient:
         assert "https://custom.kinde.com/oauth2/auth" in url
         assert "client_id=custom_id" in url
 
+    async def test_http_client_is_shared(self, mock_env_vars):
+        """Test that OAuth calls share one pooled HTTP client until closed."""
+        client = KindeClient()
+
+        first = await client._client()
+        second = await client._client()
+
+        assert first is second
+        assert str(first.base_url).startswith("https://test.kinde.com")
+
+        await client.aclose()
+        assert client._http is None
+
     def test_decode_token(self, mock_env_vars):
         """Test JWT token decoding."""
         client = KindeClient()
 
         # Create a simple JWT-like token (base64 encoded)
-        import base64
-        import json
-
         header = (
             base64.urlsafe_b64encode(json.dumps({"alg": "RS256"}).encode()).decode().rstrip("=")
         )
@@ -84,6 +118,23 @@ class TestKindeClient:
         assert user.given_name == "Test"
         assert user.family_name == "User"
 
+    def test_decode_token_urlsafe_alphabet(self, mock_env_vars):
+        """Test JWT decoding of payloads that use the "-" and "_" base64url characters."""
+        client = KindeClient()
+
+        # {"sub": "~~~???>>>"} encodes to a segment containing both "-" and "_"
+        payload = "eyJzdWIiOiAifn5-Pz8_Pj4-In0"
+        user = client._decode_token(f"e30.{payload}.sig")
+
+        assert user.sub == "~~~???>>>"
+
+    def test_decode_token_invalid_format(self, mock_env_vars):
+        """Test that tokens without three segments are rejected."""
+        client = KindeClient()
+
+        with pytest.raises(Exception, match="Invalid JWT format"):
+            client._decode_token("not-a-jwt")
+
 
 class TestKindeClientSingleton:
     """Tests for singleton behavior."""
@@ -91,9 +142,7 @@ class TestKindeClientSingleton:
     def test_get_kinde_client_returns_same_instance(self, mock_env_vars):
         """Test that get_kinde_client returns singleton."""
         # Reset singleton
-        import arclio_login.kinde_client as kc
-
-        kc._kinde_client = None
+        get_kinde_client.cache_clear()
 
         client1 = get_kinde_client()
         client2 = get_kinde_client()
@@ -1,5 +1,9 @@
 """Tests for OAuth callback server."""
 
+import asyncio
+import socket
+import urllib.request
+
 import pytest
 
 from arclio_login.oauth_server import OAuthCallbackServer
@@ -8,12 +12,27 @@ from arclio_login.oauth_server import OAuthCallbackServer
 class TestOAuthCallbackServer:
     """Tests for local OAuth callback server."""
 
-    def test_find_available_port(self):
-        """Test finding an available port."""
+    def test_start_uses_listed_port(self):
+        """Test that the server binds a port from the preferred list."""
         server = OAuthCallbackServer()
-        port = server._find_available_port([3100, 3101, 3102])
 
-        assert port in [3100, 3101, 3102]
+        port = server.start([3100, 3101, 3102])
+        try:
+            assert port in [3100, 3101, 3102]
+        finally:
+            server.close()
+
+    def test_start_fails_when_ports_taken(self):
+        """Test that start reports an error when every listed port is taken."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen(1)
+            taken_port = taken.getsockname()[1]
+
+            server = OAuthCallbackServer()
+            with pytest.raises(Exception, match="No available ports"):
+                server.start([taken_port])
+            assert server.server is None
 
     def test_start_and_close(self):
         """Test starting and stopping server."""
@@ -49,3 +68,56 @@ class TestOAuthCallbackServer:
                 await server.wait_for_callback(timeout=0.1)
         finally:
             server.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_callback_receives_code(self):
+        """Test that a callback request wakes wait_for_callback."""
+        server = OAuthCallbackServer()
+        port = server.start()
+
+        try:
+            url = f"http://127.0.0.1:{port}/callback?code=abc&state=xyz"
+            fetch = asyncio.to_thread(lambda: urllib.request.urlopen(url).read())
+            result, _ = await asyncio.gather(server.wait_for_callback(timeout=5), fetch)
+
+            assert result.code == "abc"
+            assert result.state == "xyz"
+            assert result.error is None
+        finally:
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_callback_receives_error(self):
+        """Test that an OAuth error redirect is reported with an error page."""
+        server = OAuthCallbackServer()
+        port = server.start()
+
+        try:
+            url = f"http://127.0.0.1:{port}/callback?error=access_denied&error_description=Denied"
+            fetch = asyncio.to_thread(lambda: urllib.request.urlopen(url).read())
+            result, body = await asyncio.gather(server.wait_for_callback(timeout=5), fetch)
+
+            assert result.error == "access_denied"
+            assert result.error_description == "Denied"
+            assert b"access_denied: Denied" in body
+        finally:
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_restart_reuses_port_after_callback(self):
+        """Test that a quick retry rebinds the same port despite TIME_WAIT."""
+        server = OAuthCallbackServer()
+        port = server.start([0])
+
+        try:
+            url = f"http://127.0.0.1:{port}/callback?code=abc"
+            fetch = asyncio.to_thread(lambda: urllib.request.urlopen(url).read())
+            await asyncio.gather(server.wait_for_callback(timeout=5), fetch)
+        finally:
+            server.close()
+
+        retry = OAuthCallbackServer()
+        try:
+            assert retry.start([port]) == port
+        finally:
+            retry.close()
@@ -0,0 +1,49 @@
+"""Tests for token manager."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from arclio_login import config
+from arclio_login.token_manager import get_valid_token_fast, get_valid_token_sync
+from arclio_login.types import KindeTokens
+
+
+class TestGetValidToken:
+    """Tests for valid token retrieval."""
+
+    def test_fast_path_returns_valid_token(self, temp_config_dir: Path):
+        """Test that a non-expired token is returned directly."""
+        tokens = KindeTokens(access_token="test_token", expires_in=3600)
+        config.set_tokens(tokens)
+
+        assert get_valid_token_fast() == "test_token"
+
+    def test_fast_path_skips_expired_token(self, temp_config_dir: Path):
+        """Test that an expired token is not returned by the fast path."""
+        creds = {"access_token": "test", "expires_at": 1000}
+        with open(temp_config_dir / "credentials.json", "w") as f:
+            json.dump(creds, f)
+
+        assert get_valid_token_fast() is None
+
+    def test_sync_valid_token_skips_event_loop(self, temp_config_dir: Path):
+        """Test that the sync wrapper does not start a loop for a valid token."""
+        tokens = KindeTokens(access_token="test_token", expires_in=3600)
+        config.set_tokens(tokens)
+
+        with patch("arclio_login.token_manager.asyncio.run") as run:
+            assert get_valid_token_sync() == "test_token"
+
+        run.assert_not_called()
+
+    def test_sync_expired_without_refresh_token(self, temp_config_dir: Path):
+        """Test that an expired token without refresh token raises."""
+        creds = {"access_token": "test", "expires_at": 1000}
+        with open(temp_config_dir / "credentials.json", "w") as f:
+            json.dump(creds, f)
+
+        with pytest.raises(Exception, match="no refresh token"):
+            get_valid_token_sync()